@@ -11,7 +11,9 @@ Usage:
 """
 
 import argparse
+import functools
 import logging
+import os
 import sys
 from pathlib import Path
 from typing import Callable, Optional
@@ -19,8 +21,9 @@ from typing import Callable, Optional
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
+from src.models.agent import Agent
 from src.models.market import Market
-from src.auction.ascending import AscendingAuction, AuctionResult
+from src.auction.ascending import AuctionResult
 from src.experiments.scenarios import (
     create_book_example_1,
     create_book_example_1_two_cpus,
@@ -32,23 +35,17 @@ from src.experiments.scenarios import (
     create_competitive_scenario,
     create_24h_night_discount_scenario,
 )
+from src.experiments.cache import CACHE_DIR, cached_run, clear_cache
 from src.experiments.metrics import (
     compute_metrics,
     print_metrics_report,
     run_epsilon_sensitivity,
+    run_epsilon_sensitivity_batch,
     EpsilonSensitivityResult,
 )
-from src.visualization.plots import (
-    plot_price_evolution,
-    plot_allocation_timeline,
-    plot_allocation_and_prices,
-    plot_epsilon_sensitivity,
-    plot_epsilon_sensitivity_all,
-    plot_convergence_trace,
-)
-
-import matplotlib.pyplot as plt
 
+# matplotlib and src.visualization are imported lazily inside the functions that
+# plot, so text-only runs (e.g. --example 2, --sensitivity --no-plots) skip their startup cost.
 
 logging.basicConfig(
     level=logging.INFO,
@@ -56,19 +53,62 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# On-disk auction result cache; enabled by --cache.
+_cache_dir: Optional[Path] = None
+
+
+@functools.lru_cache(maxsize=1)
+def _output_dir() -> Path:
+    """Plot output directory, created on first use (mkdir runs once per process)."""
+    path = Path("output")
+    path.mkdir(exist_ok=True)
+    return path
+
+
+def _cached_run(
+    market: Market,
+    epsilon: float,
+    max_iterations: int = 10000,
+    record_trace: bool = False,
+    cache: bool = True,
+) -> AuctionResult:
+    """
+    Run the ascending auction through the on-disk result cache.
+
+    Pass cache=False for markets from an unseeded random factory: their key is
+    new on every run, so a cached result would never be read back.
+    """
+    return cached_run(
+        market, epsilon, max_iterations,
+        cache_dir=_cache_dir if cache else None, record_trace=record_trace,
+    )
+
+
+def _print_agents(agents: list[Agent], header: Optional[str] = "  Agents:") -> None:
+    """Print the job parameters (under an optional header line) with a single print call."""
+    lines = [header] if header is not None else []
+    lines.extend(
+        f"    {a.name}: λ={a.required_slots}, d=slot_{a.deadline_slot_id}, w=${a.worth:.2f}"
+        for a in agents
+    )
+    print("\n".join(lines))
+
 
 def print_final_market_state(result) -> None:
     """Print final allocation and bid prices after an auction run."""
     market = result.market
-    print("  Final allocation:")
-    for agent in market.agents:
-        slots = market.allocations.get(agent.agent_id, frozenset())
-        slot_ids = sorted([s.slot_id for s in slots])
-        print(f"    {agent.name}: slots {slot_ids}")
-    print("  Bid prices:")
-    for slot in market.slots:
-        price = market.bid_prices.get(slot.slot_id, slot.reserve_price)
-        print(f"    Slot {slot.slot_id} ({slot.time_label}): ${price:.2f}")
+    lines = ["  Final allocation:"]
+    lines.extend(
+        f"    {agent.name}: slots {list(market.get_sorted_slot_ids(agent))}"
+        for agent in market.agents
+    )
+    lines.append("  Bid prices:")
+    prices = market.bid_prices  # holds every slot (see Market.__post_init__)
+    lines.extend(
+        f"    Slot {slot.slot_id} ({slot.time_label}): ${prices[slot.slot_id]:.2f}"
+        for slot in market.slots
+    )
+    print("\n".join(lines))
 
 
 def run_book_example_1(epsilon: float = 0.25, show_trace: bool = True, two_cpus: bool = False) -> None:
@@ -86,14 +126,11 @@ def run_book_example_1(epsilon: float = 0.25, show_trace: bool = True, two_cpus:
     print(f"\nInitial Market Configuration:")
     slots_desc = f"{len(market.slots)} (2 CPUs × 8 times, 9am-5pm)" if two_cpus else f"{len(market.slots)} (9am-5pm)"
     print(f"  Slots: {slots_desc}, Reserve: $3.00/hour")
-    print(f"  Agents:")
-    for agent in market.agents:
-        print(f"    {agent.name}: λ={agent.required_slots}, d=slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(market.agents)
     
     # Run auction
     print(f"\nRunning Ascending Auction with ε=${epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, record_trace=show_trace)
     
     if show_trace:
         result.print_trace(max_rounds=100)
@@ -113,12 +150,9 @@ def run_many_jobs_example(epsilon: float = 0.25, show_trace: bool = True, two_cp
     slots_desc = f"{len(market.slots)} (2 CPUs × 8 times)" if two_cpus else f"{len(market.slots)} (9am-5pm)"
     print("\nMany-Jobs Example:")
     print(f"  Slots: {slots_desc}, Reserve: $3.00/hour")
-    print(f"  Agents: {len(market.agents)} jobs")
-    for agent in market.agents:
-        print(f"    {agent.name}: {agent.required_slots}h, deadline slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(market.agents, header=f"  Agents: {len(market.agents)} jobs")
     print(f"\nRunning Ascending Auction with eps=${epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, record_trace=show_trace)
     if show_trace:
         result.print_trace(max_rounds=150)
     print("\nFinal market state:")
@@ -135,12 +169,12 @@ def run_duplicate_example_1(epsilon: float = 0.25, show_trace: bool = True, two_
     slots_desc = f"{len(market.slots)} (2 CPUs x 8 times)" if two_cpus else f"{len(market.slots)} (9am-5pm)"
     print("\nDuplicate Example 1 (same job types as book example 1, each doubled):")
     print(f"  Slots: {slots_desc}, Reserve: $3.00/hour")
-    print(f"  Agents: {len(market.agents)} jobs (Job1=Job5, Job2=Job6, Job3=Job7, Job4=Job8)")
-    for agent in market.agents:
-        print(f"    {agent.name}: {agent.required_slots}h, deadline slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(
+        market.agents,
+        header=f"  Agents: {len(market.agents)} jobs (Job1=Job5, Job2=Job6, Job3=Job7, Job4=Job8)",
+    )
     print(f"\nRunning Ascending Auction with eps=${epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, record_trace=show_trace)
     if show_trace:
         result.print_trace(max_rounds=150)
     print("\nFinal market state:")
@@ -161,13 +195,10 @@ def run_book_example_2(epsilon: float = 0.25, two_cpus: bool = False) -> Auction
     slots_desc = "4 (2 CPUs × 9am, 10am)" if two_cpus else "2 (9am, 10am)"
     print(f"\nMarket Configuration:")
     print(f"  Slots: {slots_desc}, Reserve: $3.00/hour")
-    print(f"  Agents:")
-    for agent in market.agents:
-        print(f"    {agent.name}: λ={agent.required_slots}, d=slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(market.agents)
 
     print(f"\nRunning Ascending Auction with ε={epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon, max_iterations=100)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, max_iterations=100)
     print(f"  Iterations: {result.iterations}")
     print(f"  Solution: ${result.final_solution_value:.2f}")
     print_final_market_state(result)
@@ -187,13 +218,10 @@ def run_book_example_3() -> AuctionResult:
     print(f"\nMarket Configuration:")
     print(f"  Slot 0: 9am, Reserve: $1.00")
     print(f"  Slot 1: 10am, Reserve: $9.00")
-    print(f"  Agents:")
-    for agent in market.agents:
-        print(f"    {agent.name}: λ={agent.required_slots}, d=slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(market.agents)
 
     print(f"\nRunning Ascending Auction with ε=$0.25...")
-    auction = AscendingAuction(epsilon=0.25)
-    result = auction.run(market)
+    result = _cached_run(market, 0.25)
 
     print(f"\nAuction Result:")
     print(f"  Solution: ${result.final_solution_value:.2f}")
@@ -208,11 +236,9 @@ def run_competitive_scenario(epsilon: float = 0.25) -> AuctionResult:
     print("\n" + "=" * 70)
     market = create_competitive_scenario()
     print(f"\nMarket Configuration (Competitive): 4 slots, 4 agents")
-    for agent in market.agents:
-        print(f"  {agent.name}: λ={agent.required_slots}, d=slot_{agent.deadline_slot_id}, w=${agent.worth:.2f}")
+    _print_agents(market.agents, header=None)
     print(f"\nRunning Ascending Auction with ε={epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon, max_iterations=100)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, max_iterations=100)
     print(f"  Iterations: {result.iterations}")
     print(f"  Solution: ${result.final_solution_value:.2f}")
     print_final_market_state(result)
@@ -230,17 +256,42 @@ def run_24h_night_discount_scenario(
     print(f"\nMarket Configuration (24h, night discount): {slots_desc} slots, 20 jobs")
     print("  Night slots (10 PM–6 AM): discounted reserve. Day slots: full reserve.")
     print(f"\nRunning Ascending Auction with ε={epsilon:.2f}...")
-    auction = AscendingAuction(epsilon=epsilon, max_iterations=200)
-    result = auction.run(market)
+    result = _cached_run(market, epsilon, max_iterations=200, cache=False)
     print(f"  Iterations: {result.iterations}")
     print(f"  Solution: ${result.final_solution_value:.2f}")
     print_final_market_state(result)
     return result
 
 
+# --example N -> (runner(epsilon, two_cpus) -> AuctionResult, plot title, plot file name,
+# show). Title and file name are formatted with eps and suffix ("_2cpus" when --two-cpus
+# is set). With --save, examples whose show flag is set also open the plot window unless
+# --no-plots is given; the others only write the file.
+EXAMPLES: dict[int, tuple[Callable[[float, bool], AuctionResult], str, str, bool]] = {
+    1: (lambda eps, two_cpus: run_book_example_1(epsilon=eps, two_cpus=two_cpus)[0],
+        "Allocation and Prices - Example 1 (ε={eps})", "ex1_allocation_eps{eps}{suffix}.png", True),
+    2: (lambda eps, two_cpus: run_book_example_2(epsilon=eps, two_cpus=two_cpus),
+        "Allocation and Prices - Example 2 (ε={eps}){suffix}", "ex2_allocation_eps{eps}{suffix}.png", False),
+    3: (lambda eps, two_cpus: run_book_example_3(),
+        "Allocation and Prices - Example 3", "ex3_allocation.png", False),
+    4: (lambda eps, two_cpus: run_many_jobs_example(epsilon=eps, two_cpus=two_cpus)[0],
+        "Many Jobs (ε={eps}){suffix}", "ex4_many_jobs{suffix}.png", True),
+    5: (lambda eps, two_cpus: run_duplicate_example_1(epsilon=eps, two_cpus=two_cpus)[0],
+        "Duplicate Ex1 (ε={eps}){suffix}", "ex5_duplicate_ex1_eps{eps}{suffix}.png", True),
+    6: (lambda eps, two_cpus: run_competitive_scenario(epsilon=eps),
+        "Allocation and Prices - Competitive (ε={eps})", "competitive_allocation_eps{eps}.png", True),
+    7: (lambda eps, two_cpus: run_24h_night_discount_scenario(epsilon=eps, two_cpus=two_cpus),
+        "Allocation and Prices - 24h Night Discount (ε={eps}){suffix}",
+        "scalability_24h_allocation_eps{eps}{suffix}.png", True),
+}
+
 # Epsilon values used in sensitivity analysis [0.05, 0.1, 0.15, ..., 2.95, 3.00].
 SENSITIVITY_EPSILONS = [round(0.05 + i * 0.05, 2) for i in range(60)]
 
+# Seed for the randomly generated 24h scenarios in sensitivity analysis, so a sweep
+# is reproducible and its results can be reused from the on-disk cache.
+SENSITIVITY_SEED = 0
+
 # Experiments to include in sensitivity analysis: (label, market_factory)
 # Single-CPU and multi-CPU (2 CPUs) variants where applicable.
 SENSITIVITY_EXPERIMENTS = [
@@ -254,8 +305,8 @@ SENSITIVITY_EXPERIMENTS = [
     ("Example 5 (duplicate ex1)", lambda: create_duplicate_example_1(num_cpus=1)),
     ("Example 5 (duplicate ex1, 2 CPUs)", lambda: create_duplicate_example_1(num_cpus=2)),
     ("Competitive", create_competitive_scenario),
-    ("Scalability (24h, 20 jobs)", lambda: create_24h_night_discount_scenario(num_agents=20)),
-    ("Scalability (24h, 20 jobs, 2 CPUs)", lambda: create_24h_night_discount_scenario(num_agents=20, num_cpus=2)),
+    ("Scalability (24h, 20 jobs)", lambda: create_24h_night_discount_scenario(num_agents=20, seed=SENSITIVITY_SEED)),
+    ("Scalability (24h, 20 jobs, 2 CPUs)", lambda: create_24h_night_discount_scenario(num_agents=20, num_cpus=2, seed=SENSITIVITY_SEED)),
 ]
 
 
@@ -274,7 +325,7 @@ def get_sensitivity_experiment(example: int, two_cpus: bool) -> tuple[str, Calla
     if example == 6:
         return ("Competitive", create_competitive_scenario)
     if example == 7:
-        return ("Scalability (24h, 20 jobs, 2 CPUs)", lambda: create_24h_night_discount_scenario(num_agents=20, num_cpus=2)) if two_cpus else ("Scalability (24h, 20 jobs)", lambda: create_24h_night_discount_scenario(num_agents=20))
+        return ("Scalability (24h, 20 jobs, 2 CPUs)", lambda: create_24h_night_discount_scenario(num_agents=20, num_cpus=2, seed=SENSITIVITY_SEED)) if two_cpus else ("Scalability (24h, 20 jobs)", lambda: create_24h_night_discount_scenario(num_agents=20, seed=SENSITIVITY_SEED))
     raise ValueError(f"Unknown example: {example}")
 
 
@@ -284,6 +335,7 @@ def run_epsilon_sensitivity_single(
     show_plots: bool = True,
     save_plots: bool = False,
     output_dir: Optional[Path] = None,
+    jobs: int = 1,
 ) -> None:
     """
     Run epsilon sensitivity analysis for a single experiment.
@@ -297,7 +349,7 @@ def run_epsilon_sensitivity_single(
     print("Running sensitivity...\n")
 
     market = market_fn()
-    sensitivity = run_epsilon_sensitivity(market, epsilons)
+    sensitivity = run_epsilon_sensitivity(market, epsilons, jobs=jobs, cache_dir=_cache_dir)
 
     print(f"  {name}:")
     print(f"    {'Eps':<8} {'Iters':<10} {'Solution ($)':<12}")
@@ -306,21 +358,27 @@ def run_epsilon_sensitivity_single(
     print()
 
     if show_plots or save_plots:
+        import matplotlib.pyplot as plt
+        from src.visualization.plots import plot_epsilon_sensitivity, save_figure
+
         fig = plot_epsilon_sensitivity(sensitivity, title=f"Epsilon Sensitivity — {name}", save_path=None)
         if fig:
             if save_plots and output_dir:
                 safe_name = name.lower().replace(" ", "_").replace("(", "").replace(")", "").replace(",", "")
                 path = output_dir / f"epsilon_sensitivity_{safe_name}.png"
-                fig.savefig(str(path), dpi=150, bbox_inches="tight")
+                save_figure(fig, str(path))
                 print(f"Sensitivity plot saved to {path}")
             if show_plots:
                 plt.show()
+            else:
+                plt.close(fig)
 
 
 def run_epsilon_sensitivity_analysis(
     show_plots: bool = True,
     save_plots: bool = False,
     output_dir: Optional[Path] = None,
+    jobs: int = 1,
 ) -> None:
     """
     Run epsilon sensitivity analysis for all experiments (examples 1–5,
@@ -334,12 +392,13 @@ def run_epsilon_sensitivity_analysis(
     print(f"\nEpsilon values: {epsilons}")
     print("Running sensitivity for each experiment...\n")
 
-    results: list[tuple[str, EpsilonSensitivityResult]] = []
-    for name, market_fn in SENSITIVITY_EXPERIMENTS:
-        market = market_fn()
-        sensitivity = run_epsilon_sensitivity(market, epsilons)
-        results.append((name, sensitivity))
+    # All (experiment, epsilon) runs go through one batch so --jobs shares a single pool
+    names = [name for name, _ in SENSITIVITY_EXPERIMENTS]
+    markets = [market_fn() for _, market_fn in SENSITIVITY_EXPERIMENTS]
+    sensitivities = run_epsilon_sensitivity_batch(markets, epsilons, jobs=jobs, cache_dir=_cache_dir)
+    results: list[tuple[str, EpsilonSensitivityResult]] = list(zip(names, sensitivities))
 
+    for name, sensitivity in results:
         print(f"  {name}:")
         print(f"    {'Eps':<8} {'Iters':<10} {'Solution ($)':<12}")
         for i, eps in enumerate(sensitivity.epsilons):
@@ -347,20 +406,32 @@ def run_epsilon_sensitivity_analysis(
         print()
 
     if show_plots or save_plots:
+        import matplotlib.pyplot as plt
+        from src.visualization.plots import plot_epsilon_sensitivity_all, save_figure
+
         fig = plot_epsilon_sensitivity_all(results, save_path=None)
         if fig:
             if save_plots and output_dir:
                 path = output_dir / "epsilon_sensitivity_all.png"
-                fig.savefig(str(path), dpi=150, bbox_inches="tight")
+                save_figure(fig, str(path))
                 print(f"Sensitivity plot saved to {path}")
             if show_plots:
                 plt.show()
+            else:
+                plt.close(fig)
 
 
-def run_all_experiments(save_plots: bool = False) -> None:
+def run_all_experiments(save_plots: bool = False, jobs: int = 1) -> None:
     """Run all experiments with full visualization."""
-    output_dir = Path("output")
-    output_dir.mkdir(exist_ok=True)
+    output_dir = _output_dir() if save_plots else None
+    if save_plots:
+        import matplotlib.pyplot as plt
+        from src.visualization.plots import plot_allocation_and_prices, plot_price_evolution, save_figure
+
+        def save_plot(fig, filename: str) -> None:
+            if fig is not None:
+                save_figure(fig, str(output_dir / filename))
+                plt.close(fig)
     
     # Example 1 with ε=0.25 (should converge)
     print("\n" + "#" * 70)
@@ -369,36 +440,48 @@ def run_all_experiments(save_plots: bool = False) -> None:
     result1, metrics1 = run_book_example_1(epsilon=0.25, show_trace=True)
     
     if save_plots:
-        plot_price_evolution(result1, title="Price Evolution - Example 1 (ε=0.25)",
-                            save_path=str(output_dir / "ex1_prices_025.png"))
-        plot_allocation_and_prices(result1, title="Allocation and Prices - Example 1 (ε=0.25)",
-                                  save_path=str(output_dir / "ex1_allocation_025.png"))
+        save_plot(
+            plot_price_evolution(result1, title="Price Evolution - Example 1 (ε=0.25)"),
+            "ex1_prices_025.png",
+        )
+        save_plot(
+            plot_allocation_and_prices(result1, title="Allocation and Prices - Example 1 (ε=0.25)"),
+            "ex1_allocation_025.png",
+        )
     # Example 1 with ε=1.0
     print("\n" + "#" * 70)
     print("# Running Book Example 1 with ε=1.0")
     print("#" * 70)
     result1b, metrics1b = run_book_example_1(epsilon=1.0, show_trace=True)
     if save_plots:
-        plot_price_evolution(result1b, title="Price Evolution - Example 1 (ε=1.0)",
-                            save_path=str(output_dir / "ex1_prices_10.png"))
-        plot_allocation_and_prices(result1b, title="Allocation and Prices - Example 1 (ε=1.0)",
-                                  save_path=str(output_dir / "ex1_allocation_10.png"))
+        save_plot(
+            plot_price_evolution(result1b, title="Price Evolution - Example 1 (ε=1.0)"),
+            "ex1_prices_10.png",
+        )
+        save_plot(
+            plot_allocation_and_prices(result1b, title="Allocation and Prices - Example 1 (ε=1.0)"),
+            "ex1_allocation_10.png",
+        )
     # Example 2
     print("\n" + "#" * 70)
     print("# Running Book Example 2 with ε=0.25")
     print("#" * 70)
     result2 = run_book_example_2(epsilon=0.25)
     if save_plots and result2 is not None:
-        plot_allocation_and_prices(result2, title="Allocation and Prices - Example 2 (ε=0.25)",
-                                  save_path=str(output_dir / "ex2_allocation_eps0.25.png"))
+        save_plot(
+            plot_allocation_and_prices(result2, title="Allocation and Prices - Example 2 (ε=0.25)"),
+            "ex2_allocation_eps0.25.png",
+        )
     # Example 3 (suboptimal)
     print("\n" + "#" * 70)
     print("# Running Book Example 3 (Suboptimal Case)")
     print("#" * 70)
     result3 = run_book_example_3()
     if save_plots and result3 is not None:
-        plot_allocation_and_prices(result3, title="Allocation and Prices - Example 3",
-                                  save_path=str(output_dir / "ex3_allocation.png"))
+        save_plot(
+            plot_allocation_and_prices(result3, title="Allocation and Prices - Example 3"),
+            "ex3_allocation.png",
+        )
     
     # Epsilon sensitivity (all experiments)
     print("\n" + "#" * 70)
@@ -407,7 +490,8 @@ def run_all_experiments(save_plots: bool = False) -> None:
     run_epsilon_sensitivity_analysis(
         show_plots=not save_plots,
         save_plots=save_plots,
-        output_dir=output_dir if save_plots else None,
+        output_dir=output_dir,
+        jobs=jobs,
     )
     if save_plots:
         print(f"\nPlots saved to {output_dir}/")
@@ -431,11 +515,12 @@ Examples:
   python main.py --sensitivity       Run epsilon sensitivity (all experiments)
   python main.py -s -e 1             Sensitivity for Example 1 only
   python main.py -s -e 4 --two-cpus Sensitivity for Example 4 with 2 CPUs
+  python main.py -s -j 0             Sensitivity using all CPU cores
   python main.py --all --save        Run all experiments and save plots
         """
     )
     
-    parser.add_argument("--example", "-e", type=int, choices=[1, 2, 3, 4, 5, 6, 7],
+    parser.add_argument("--example", "-e", type=int, choices=sorted(EXAMPLES),
                        help="Run specific example (1-3: book, 4: many jobs, 5: duplicate ex1, 6: competitive, 7: 24h night discount)")
     parser.add_argument("--eps", type=float, default=0.25,
                        help="Epsilon value for auction (default: 0.25)")
@@ -449,8 +534,24 @@ Examples:
                        help="Disable plot display")
     parser.add_argument("--two-cpus", action="store_true",
                        help="Use 2 identical CPUs (examples 1, 2, 4, 5)")
+    parser.add_argument("--cache", action="store_true",
+                       help="Reuse auction results cached under output/.cache (and cache new ones)")
+    parser.add_argument("--clear-cache", action="store_true",
+                       help="Delete cached auction results before running")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                       help="Worker processes for epsilon sensitivity (default: 1, 0 = all cores)")
     
     args = parser.parse_args()
+
+    if args.save and (args.no_plots or args.all):
+        # Save-only run (--all --save never shows figures): skip probing Tk/Qt backends
+        os.environ.setdefault("MPLBACKEND", "Agg")
+
+    global _cache_dir
+    if args.clear_cache:
+        clear_cache(CACHE_DIR)
+    if args.cache:
+        _cache_dir = CACHE_DIR
     
     # Default behavior: run all book examples
     if not any([args.example, args.sensitivity, args.all]):
@@ -458,96 +559,43 @@ Examples:
     
     try:
         if args.all:
-            run_all_experiments(save_plots=args.save)
+            run_all_experiments(save_plots=args.save, jobs=args.jobs)
         elif args.sensitivity and args.example is not None:
             name, market_fn = get_sensitivity_experiment(args.example, args.two_cpus)
-            out_dir = Path("output") if args.save else None
-            if args.save:
-                out_dir.mkdir(exist_ok=True)
+            out_dir = _output_dir() if args.save else None
             run_epsilon_sensitivity_single(
                 name=name,
                 market_fn=market_fn,
                 show_plots=not args.no_plots,
                 save_plots=args.save,
                 output_dir=out_dir,
+                jobs=args.jobs,
             )
         elif args.sensitivity:
-            out_dir = Path("output") if args.save else None
-            if args.save:
-                out_dir.mkdir(exist_ok=True)
+            out_dir = _output_dir() if args.save else None
             run_epsilon_sensitivity_analysis(
                 show_plots=not args.no_plots,
                 save_plots=args.save,
                 output_dir=out_dir,
+                jobs=args.jobs,
             )
-        elif args.example == 1:
-            result1, _ = run_book_example_1(epsilon=args.eps, two_cpus=args.two_cpus)
-            if args.save:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
+        elif args.example is not None:
+            runner, title, filename, show = EXAMPLES[args.example]
+            result = runner(args.eps, args.two_cpus)
+            if args.save and result is not None:
+                import matplotlib.pyplot as plt
+                from src.visualization.plots import plot_allocation_and_prices
+
+                output_dir = _output_dir()
                 suffix = "_2cpus" if args.two_cpus else ""
-                plot_allocation_and_prices(result1, title=f"Allocation and Prices - Example 1 (ε={args.eps})",
-                                          save_path=str(output_dir / f"ex1_allocation_eps{args.eps}{suffix}.png"))
-            if not args.no_plots:
-                plt.show()
-        elif args.example == 2:
-            result2 = run_book_example_2(epsilon=args.eps, two_cpus=args.two_cpus)
-            if args.save and result2 is not None:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                suffix = "_2cpus" if args.two_cpus else ""
-                plot_allocation_and_prices(result2, title=f"Allocation and Prices - Example 2 (ε={args.eps}){suffix}",
-                                          save_path=str(output_dir / f"ex2_allocation_eps{args.eps}{suffix}.png"))
-                print(f"\nPlot saved to {output_dir / f'ex2_allocation_eps{args.eps}{suffix}.png'}")
-        elif args.example == 3:
-            result3 = run_book_example_3()
-            if args.save:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                plot_allocation_and_prices(result3, title="Allocation and Prices - Example 3",
-                                          save_path=str(output_dir / "ex3_allocation.png"))
-                print(f"\nPlot saved to {output_dir / 'ex3_allocation.png'}")
-        elif args.example == 4:
-            result4, _ = run_many_jobs_example(epsilon=args.eps, two_cpus=args.two_cpus)
-            if args.save:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                suffix = "_2cpus" if args.two_cpus else ""
-                plot_allocation_and_prices(result4, title=f"Many Jobs (ε={args.eps}){suffix}",
-                                          save_path=str(output_dir / f"ex4_many_jobs{suffix}.png"))
-            if not args.no_plots:
-                plt.show()
-        elif args.example == 5:
-            result5, _ = run_duplicate_example_1(epsilon=args.eps, two_cpus=args.two_cpus)
-            if args.save:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                suffix = "_2cpus" if args.two_cpus else ""
-                plot_allocation_and_prices(result5, title=f"Duplicate Ex1 (ε={args.eps}){suffix}",
-                                          save_path=str(output_dir / f"ex5_duplicate_ex1_eps{args.eps}{suffix}.png"))
-            if not args.no_plots:
-                plt.show()
-        elif args.example == 6:
-            result6 = run_competitive_scenario(epsilon=args.eps)
-            if args.save and result6 is not None:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                plot_allocation_and_prices(result6, title=f"Allocation and Prices - Competitive (ε={args.eps})",
-                                          save_path=str(output_dir / f"competitive_allocation_eps{args.eps}.png"))
-                print(f"\nPlot saved to {output_dir / f'competitive_allocation_eps{args.eps}.png'}")
-            if not args.no_plots:
-                plt.show()
-        elif args.example == 7:
-            result7 = run_24h_night_discount_scenario(epsilon=args.eps, two_cpus=args.two_cpus)
-            if args.save and result7 is not None:
-                output_dir = Path("output")
-                output_dir.mkdir(exist_ok=True)
-                suffix = "_2cpus" if args.two_cpus else ""
-                plot_allocation_and_prices(result7, title=f"Allocation and Prices - 24h Night Discount (ε={args.eps}){suffix}",
-                                          save_path=str(output_dir / f"scalability_24h_allocation_eps{args.eps}{suffix}.png"))
-                print(f"\nPlot saved to {output_dir / f'scalability_24h_allocation_eps{args.eps}{suffix}.png'}")
-            if not args.no_plots:
-                plt.show()
+                path = output_dir / filename.format(eps=args.eps, suffix=suffix)
+                fig = plot_allocation_and_prices(result, title=title.format(eps=args.eps, suffix=suffix),
+                                                 save_path=str(path))
+                print(f"\nPlot saved to {path}")
+                if show and not args.no_plots:
+                    plt.show()
+                else:
+                    plt.close(fig)
     except KeyboardInterrupt:
         print("\nInterrupted by user")
         sys.exit(1)
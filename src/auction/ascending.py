@@ -1,5 +1,5 @@
 import logging
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import FrozenSet, Optional
 
 from src.models.agent import Agent
@@ -10,7 +10,7 @@ from src.models.market import Market
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionRound:
     """Record of a single auction round for tracing."""
     round_num: int
@@ -20,7 +20,7 @@ class AuctionRound:
     bid_prices: list[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class AuctionResult:
     """Result of running the ascending auction."""
     market: Market
@@ -28,6 +28,7 @@ class AuctionResult:
     converged: bool
     iterations: int
     final_solution_value: float
+    num_rounds: int = 0  # bidding rounds run (len(rounds) only when the trace was recorded)
     
     def print_trace(self, max_rounds: Optional[int] = None) -> None:
         """Print a trace of the auction similar to the book's tables."""
@@ -67,35 +68,74 @@ class AscendingAuction:
     3. Return final allocations and prices
     """
     
-    def __init__(self, epsilon=0.25, max_iterations=10000):
+    def __init__(self, epsilon=0.25, max_iterations=10000, record_trace=False):
         """
         Initialize the auction.
         
         Args:
             epsilon: Price increment (ε)
             max_iterations: Maximum iterations to prevent infinite loops
+            record_trace: Keep a per-round AuctionRound history (needed for
+                print_trace and price-evolution plots)
         """
         self.epsilon = epsilon
         self.max_iterations = max_iterations
+        self.record_trace = record_trace
     
-    def run(self, market: Market, verbose: bool = False) -> AuctionResult:
+    def run(
+        self, market: Market, verbose: bool = False, epsilon: Optional[float] = None
+    ) -> AuctionResult:
         """
         Run the ascending auction algorithm.
         
         Args:
             market: Initial market state
             verbose: Whether to print progress
+            epsilon: Price increment for this run (defaults to self.epsilon), so
+                one instance can be reused across an epsilon sweep
             
         Returns:
             AuctionResult with final state and trace
         """
+        if epsilon is None:
+            epsilon = self.epsilon
+
         # Work on a copy to not modify the original
         market = market.copy()
         
         # Initialize: bid prices = reserve prices (done in Market.__post_init__)
         # Initialize: all allocations empty (done in Market.__post_init__)
         
+        # Per-run invariants: slot ids in market order (bid_prices holds an entry
+        # for every slot) and the candidate bundles, which depend only on the slots
+        slot_ids = [s.slot_id for s in market.slots]
+        windows = {agent.agent_id: agent.candidate_windows(market.slots) for agent in market.agents}
+        
+        # b_j + ε for every slot, updated only when a bid changes. Each agent's ask
+        # prices are a copy of this with its own slots reset to b_j, which gives the
+        # same result as market.compute_ask_prices without a per-slot Python loop.
+        # Dense slot ids (0..m-1, as create_slots produces) use a list, which is
+        # cheaper to copy and index than a dict.
+        if sorted(slot_ids) == list(range(len(slot_ids))):
+            raised_prices: dict[int, float] | list[float] = [0.0] * len(slot_ids)
+        else:
+            raised_prices = {}
+        for i in slot_ids:
+            raised_prices[i] = market.bid_prices[i] + epsilon
+        
+        # slot_id -> owning agent, kept in step with the allocation writes below so
+        # outbidding a slot is a dict lookup rather than market.get_slot_owner's scan.
+        # Bundles are disjoint, so each slot has at most one owner.
+        slot_owner: dict[int, Agent] = {}
+        for a in market.agents:
+            for slot in market.get_allocation(a):
+                slot_owner.setdefault(slot.slot_id, a)
+        
         rounds: list[AuctionRound] = []
+        # Trace snapshots, rebuilt only after a turn that changed the market;
+        # consecutive rounds without changes share the same objects
+        allocations_snapshot: Optional[dict[int, list[int]]] = None
+        prices_snapshot: Optional[list[float]] = None
         round_num = 0
         iteration = 0
         
@@ -107,53 +147,66 @@ class AscendingAuction:
                 round_num += 1
                 
                 # Compute ask prices for this agent
-                ask_prices = market.compute_ask_prices(agent, self.epsilon)
+                current_allocation = market.get_allocation(agent)
+                ask_prices = raised_prices.copy()
+                for slot in current_allocation:
+                    ask_prices[slot.slot_id] = market.bid_prices[slot.slot_id]
                 
                 # Find best bundle at current ask prices
-                current_allocation = market.get_allocation(agent)
                 best_bundle, _ = agent.find_best_bundle(
-                    market.slots, ask_prices, current_allocation
+                    market.slots, ask_prices, current_allocation, windows[agent.agent_id]
                 )
                 
                 # Determine new slots to bid on (discrepancy from the book exammples)
                 new_slots = best_bundle - current_allocation
                 
                 # Record the round
-                rounds.append(AuctionRound(
-                    round_num=round_num,
-                    bidder=agent,
-                    slots_bid_on=new_slots,
-                    allocations={
-                        a.agent_id: sorted([s.slot_id for s in market.allocations.get(a.agent_id, frozenset())])
-                        for a in market.agents
-                    },
-                    bid_prices=[market.bid_prices.get(s.slot_id, s.reserve_price) for s in market.slots]
-                ))
+                if self.record_trace:
+                    if allocations_snapshot is None:
+                        allocations_snapshot = {
+                            a.agent_id: list(market.get_sorted_slot_ids(a))
+                            for a in market.agents
+                        }
+                        prices_snapshot = [market.bid_prices[i] for i in slot_ids]
+                    rounds.append(AuctionRound(
+                        round_num=round_num,
+                        bidder=agent,
+                        slots_bid_on=new_slots,
+                        allocations=allocations_snapshot,
+                        bid_prices=prices_snapshot
+                    ))
                 
                 # Update bids and allocations for new slots
                 for slot in new_slots:
                     # Increment bid price
-                    market.bid_prices[slot.slot_id] = market.bid_prices[slot.slot_id] + self.epsilon
+                    market.bid_prices[slot.slot_id] = market.bid_prices[slot.slot_id] + epsilon
+                    raised_prices[slot.slot_id] = market.bid_prices[slot.slot_id] + epsilon
                     
                     # Remove from other agent if allocated
-                    current_owner = market.get_slot_owner(slot)
+                    current_owner = slot_owner.get(slot.slot_id)
                     if current_owner is not None and current_owner != agent:
                         owner_allocation = market.get_allocation(current_owner)
                         market.set_allocation(current_owner, owner_allocation - {slot})
+                    slot_owner[slot.slot_id] = agent
                     
                     any_change = True
                 
                 # Update agent's allocation
                 if best_bundle != current_allocation:
+                    for slot in current_allocation - best_bundle:
+                        if slot_owner.get(slot.slot_id) == agent:
+                            del slot_owner[slot.slot_id]
                     market.set_allocation(agent, best_bundle)
                     any_change = True
+                    # new_slots is non-empty only in this case, so bids changed too
+                    allocations_snapshot = None
                 
-                if verbose and new_slots:
+                if verbose and new_slots and logger.isEnabledFor(logging.INFO):
                     logger.info(
                         "Round %d: Agent %s bids on slots %s, prices: %s",
                         round_num, agent.name,
-                        sorted([s.slot_id for s in new_slots]),
-                        [market.bid_prices.get(s.slot_id, 0) for s in market.slots]
+                        sorted(s.slot_id for s in new_slots),
+                        [market.bid_prices[i] for i in slot_ids]
                     )
             
             iteration += 1
@@ -172,5 +225,6 @@ class AscendingAuction:
             rounds=rounds,
             converged=converged,
             iterations=iteration,
-            final_solution_value=final_solution_value
+            final_solution_value=final_solution_value,
+            num_rounds=round_num
         )
@@ -0,0 +1,114 @@
+"""
+On-disk memoization of auction runs.
+
+Results are pickled under a cache directory, keyed by a hash of the market
+definition, epsilon and max_iterations, so repeated runs of the same scenario
+(e.g. `--all` followed by `--sensitivity`) skip the auction entirely. The key
+also covers the source of the src package, so editing the code invalidates
+every cached result.
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from src.models.market import Market
+from src.auction.ascending import AscendingAuction, AuctionResult
+
+
+CACHE_DIR = Path("output") / ".cache"
+
+
+@functools.lru_cache(maxsize=1)
+def source_hash() -> str:
+    """Hash of every .py file under src/ (read once per process)."""
+    root = Path(__file__).resolve().parents[1]
+    h = hashlib.blake2b(digest_size=16)
+    for path in sorted(root.rglob("*.py")):
+        h.update(path.relative_to(root).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()
+
+
+def market_key(
+    market: Market, epsilon: float, max_iterations: int, record_trace: bool = False
+) -> str:
+    """Canonical hash of (market, epsilon, max_iterations, record_trace)."""
+    agents = sorted(
+        (a.agent_id, a.name, a.deadline_slot_id, a.required_slots, a.worth)
+        for a in market.agents
+    )
+    slots = sorted(
+        (s.slot_id, s.time_label, s.reserve_price, s.time_index, s.cpu_id)
+        for s in market.slots
+    )
+    allocations = sorted(
+        (agent_id, tuple(sorted(s.slot_id for s in bundle)))
+        for agent_id, bundle in market.allocations.items()
+    )
+    bid_prices = sorted(market.bid_prices.items())
+    payload = repr((source_hash(), agents, slots, allocations, bid_prices, epsilon, max_iterations, record_trace))
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+def cached_run(
+    market: Market,
+    epsilon: float,
+    max_iterations: int = 10000,
+    cache_dir: Optional[Path] = CACHE_DIR,
+    record_trace: bool = False,
+) -> AuctionResult:
+    """
+    Run the ascending auction, reusing a pickled result when one exists.
+
+    Args:
+        market: Initial market state
+        epsilon: Price increment (ε)
+        max_iterations: Maximum iterations for the auction
+        cache_dir: Directory holding cached results (None disables caching)
+        record_trace: Keep the per-round history on the result
+
+    Returns:
+        AuctionResult, either loaded from disk or freshly computed
+    """
+    auction = AscendingAuction(max_iterations=max_iterations, record_trace=record_trace)
+    if cache_dir is None:
+        return auction.run(market, epsilon=epsilon)
+
+    path = Path(cache_dir) / f"{market_key(market, epsilon, max_iterations, record_trace)}.pkl"
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible pickle: treat it as a miss
+        pass
+
+    result = auction.run(market, epsilon=epsilon)
+
+    # Write to a temp file then rename, so concurrent workers never see a partial pickle.
+    # The cache is best-effort: if it cannot be written (e.g. read-only working
+    # directory), the result is simply not cached.
+    tmp = None
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except (OSError, pickle.PicklingError):
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+    return result
+
+
+def clear_cache(cache_dir: Path = CACHE_DIR) -> None:
+    """Delete all cached auction results."""
+    shutil.rmtree(cache_dir, ignore_errors=True)
@@ -4,13 +4,18 @@ Metrics for evaluating auction performance.
 Computes solution value, iterations, and other metrics for experimental analysis.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Optional
 
 from src.models.market import Market
 from src.auction.ascending import AuctionResult
 
 
-@dataclass
+@dataclass(slots=True)
 class ExperimentMetrics:
     """Metrics computed from an auction experiment."""
     auction_solution_value: float
@@ -37,7 +42,7 @@ def compute_metrics(result: AuctionResult, epsilon: float) -> ExperimentMetrics:
     return ExperimentMetrics(
         auction_solution_value=result.final_solution_value,
         iterations=result.iterations,
-        num_rounds=len(result.rounds),
+        num_rounds=result.num_rounds,
         converged=result.converged,
         epsilon=epsilon,
         num_agents=len(market.agents),
@@ -63,7 +68,7 @@ def print_metrics_report(metrics: ExperimentMetrics) -> None:
     print("=" * 60)
 
 
-@dataclass
+@dataclass(slots=True)
 class EpsilonSensitivityResult:
     """Result of epsilon sensitivity analysis."""
     epsilons: list[float]
@@ -71,10 +76,74 @@ class EpsilonSensitivityResult:
     solution_values: list[float]
 
 
+def _run_one_epsilon(
+    market: Market, epsilon: float, max_iterations: int, cache_dir: Optional[Path]
+) -> tuple[int, float]:
+    """Run a single auction for the sweep; top-level so it can be pickled to a worker process."""
+    from src.experiments.cache import cached_run
+
+    result = cached_run(market, epsilon, max_iterations, cache_dir=cache_dir)
+    return result.iterations, result.final_solution_value
+
+
+def run_epsilon_sensitivity_batch(
+    markets: list[Market],
+    epsilons: list[float],
+    max_iterations: int = 10000,
+    jobs: int = 1,
+    cache_dir: Optional[Path] = None,
+) -> list[EpsilonSensitivityResult]:
+    """
+    Run sensitivity analysis varying epsilon for several markets at once.
+
+    Every (market, epsilon) pair is an independent auction, so with jobs > 1
+    all pairs share a single process pool (results keep the input order).
+
+    Args:
+        markets: Markets to test
+        epsilons: List of epsilon values to test on each market
+        max_iterations: Max iterations per run
+        jobs: Number of worker processes (1 = serial, 0 = one per CPU)
+        cache_dir: Directory for on-disk memoized results (None disables caching)
+
+    Returns:
+        One EpsilonSensitivityResult per market
+    """
+    tasks = [(market, eps) for market in markets for eps in epsilons]
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    workers = min(jobs, len(tasks))
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            runs = list(executor.map(
+                _run_one_epsilon,
+                [market for market, _ in tasks],
+                [eps for _, eps in tasks],
+                repeat(max_iterations),
+                repeat(cache_dir),
+                chunksize=8,
+            ))
+    else:
+        runs = [_run_one_epsilon(market, eps, max_iterations, cache_dir) for market, eps in tasks]
+
+    n = len(epsilons)
+    return [
+        EpsilonSensitivityResult(
+            epsilons=epsilons,
+            iterations=[iterations for iterations, _ in runs[k * n:(k + 1) * n]],
+            solution_values=[value for _, value in runs[k * n:(k + 1) * n]],
+        )
+        for k in range(len(markets))
+    ]
+
+
 def run_epsilon_sensitivity(
     market: Market,
     epsilons: list[float],
-    max_iterations: int = 10000
+    max_iterations: int = 10000,
+    jobs: int = 1,
+    cache_dir: Optional[Path] = None,
 ) -> EpsilonSensitivityResult:
     """
     Run sensitivity analysis varying epsilon.
@@ -83,21 +152,12 @@ def run_epsilon_sensitivity(
         market: Market to test
         epsilons: List of epsilon values to test
         max_iterations: Max iterations per run
+        jobs: Number of worker processes (1 = serial, 0 = one per CPU)
+        cache_dir: Directory for on-disk memoized results (None disables caching)
 
     Returns:
         EpsilonSensitivityResult with results for each epsilon
     """
-    from src.auction.ascending import AscendingAuction
-
-    iterations = []
-    solution_values = []
-    for eps in epsilons:
-        auction = AscendingAuction(epsilon=eps, max_iterations=max_iterations)
-        result = auction.run(market)
-        iterations.append(result.iterations)
-        solution_values.append(result.final_solution_value)
-    return EpsilonSensitivityResult(
-        epsilons=epsilons,
-        iterations=iterations,
-        solution_values=solution_values,
-    )
+    return run_epsilon_sensitivity_batch(
+        [market], epsilons, max_iterations=max_iterations, jobs=jobs, cache_dir=cache_dir
+    )[0]
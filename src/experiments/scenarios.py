@@ -1,5 +1,9 @@
+import functools
+import random
+from typing import Optional
+
 from src.models.agent import Agent
-from src.models.slot import Slot, create_slots, create_slots_with_prices
+from src.models.slot import create_slots, create_slots_with_prices
 from src.models.market import Market
 
 
@@ -209,7 +213,8 @@ def create_single_slot_demand_scenario(
     num_agents: int = 5,
     num_slots: int = 5,
     reserve_price: float = 1.0,
-    max_worth: float = 10.0
+    max_worth: float = 10.0,
+    seed: Optional[int] = None
 ) -> Market:
     """
     Create a scenario where each agent demands only 1 slot.
@@ -219,8 +224,10 @@ def create_single_slot_demand_scenario(
         num_slots: Number of time slots
         reserve_price: Reserve price for all slots
         max_worth: Maximum worth for agents
+        seed: Seed for a private RNG (None = global random state)
     """
-    import random
+    rng = random if seed is None else random.Random(seed)
+    randint, uniform = rng.randint, rng.uniform
     
     slots = create_slots(num_slots=num_slots, reserve_price=reserve_price)
     
@@ -228,8 +235,8 @@ def create_single_slot_demand_scenario(
     for i in range(num_agents):
         # Each agent needs exactly 1 slot
         # Deadline is random but ensures at least some valid slots
-        deadline = random.randint(1, num_slots)
-        worth = random.uniform(reserve_price + 1, max_worth)
+        deadline = randint(1, num_slots)
+        worth = uniform(reserve_price + 1, max_worth)
         
         agents.append(Agent(
             agent_id=i + 1,
@@ -264,7 +271,8 @@ def create_competitive_scenario() -> Market:
 def create_scalability_scenario(
     num_agents: int,
     num_slots: int,
-    reserve_price: float = 1.0
+    reserve_price: float = 1.0,
+    seed: Optional[int] = None
 ) -> Market:
     """
     Create a scenario for scalability testing.
@@ -273,18 +281,20 @@ def create_scalability_scenario(
         num_agents: Number of agents
         num_slots: Number of time slots
         reserve_price: Reserve price for all slots
+        seed: Seed for a private RNG (None = global random state)
     """
-    import random
+    rng = random if seed is None else random.Random(seed)
+    randint, uniform = rng.randint, rng.uniform
     
     slots = create_slots(num_slots=num_slots, reserve_price=reserve_price)
     
     agents = []
     for i in range(num_agents):
         # Random required slots (1 to 3)
-        required = random.randint(1, min(3, num_slots))
+        required = randint(1, min(3, num_slots))
         # Deadline ensuring enough slots available
-        deadline = random.randint(required, num_slots)
-        worth = random.uniform(reserve_price * required + 1, reserve_price * required + 10)
+        deadline = randint(required, num_slots)
+        worth = uniform(reserve_price * required + 1, reserve_price * required + 10)
         
         agents.append(Agent(
             agent_id=i + 1,
@@ -298,7 +308,16 @@ def create_scalability_scenario(
 
 
 # Nighttime = 10 PM–6 AM (slot indices 22, 23, 0, 1, 2, 3, 4, 5 in 24-hour day starting at midnight)
-_NIGHT_SLOT_INDICES = {0, 1, 2, 3, 4, 5, 22, 23}
+_NIGHT_SLOT_INDICES = frozenset({0, 1, 2, 3, 4, 5, 22, 23})
+
+
+@functools.lru_cache(maxsize=32)
+def _night_discount_prices(day_reserve: float, night_reserve: float) -> tuple[float, ...]:
+    """Reserve price per hour of the day (computed once per price pair)."""
+    return tuple(
+        night_reserve if t in _NIGHT_SLOT_INDICES else day_reserve
+        for t in range(24)
+    )
 
 
 def create_24h_night_discount_scenario(
@@ -306,6 +325,7 @@ def create_24h_night_discount_scenario(
     day_reserve: float = 2.0,
     night_reserve: float = 1.0,
     num_cpus: int = 1,
+    seed: Optional[int] = None,
 ) -> Market:
     """
     Create a 24-hour scenario with discounted nighttime reserve prices and configurable jobs.
@@ -318,23 +338,22 @@ def create_24h_night_discount_scenario(
         day_reserve: Reserve price for daytime slots (6 AM–10 PM)
         night_reserve: Reserve price for nighttime slots (10 PM–6 AM)
         num_cpus: Number of identical CPUs (1 or 2)
+        seed: Seed for a private RNG (None = global random state)
     """
-    import random
+    rng = random if seed is None else random.Random(seed)
+    randint, uniform = rng.randint, rng.uniform
     
-    reserve_prices = [
-        night_reserve if t in _NIGHT_SLOT_INDICES else day_reserve
-        for t in range(24)
-    ]
     slots = create_slots_with_prices(
-        reserve_prices=reserve_prices, start_hour=0, num_cpus=num_cpus
+        reserve_prices=list(_night_discount_prices(day_reserve, night_reserve)),
+        start_hour=0, num_cpus=num_cpus
     )
     
     agents = []
     for i in range(num_agents):
-        required = random.randint(1, min(3, 24))
-        deadline = random.randint(required, 24)
+        required = randint(1, min(3, 24))
+        deadline = randint(required, 24)
         base = night_reserve * required
-        worth = random.uniform(base + 1, base + 10)
+        worth = uniform(base + 1, base + 10)
         agents.append(Agent(
             agent_id=i + 1,
             name=f"Agent{i + 1} ({required}h)",
@@ -1,10 +1,10 @@
 from dataclasses import dataclass
-from typing import FrozenSet, Set
+from typing import FrozenSet, Optional, Set
 
 from src.models.slot import Slot
 
 
-@dataclass
+@dataclass(slots=True)
 class Agent:
     """
     Represents an agent (job) in the scheduling problem.
@@ -48,21 +48,20 @@ class Agent:
         self, allocated_slots: Set[Slot] | FrozenSet[Slot], length: int
     ) -> bool:
         """True iff allocated_slots contains a consecutive block of length slots before deadline on one CPU."""
-        # Group by CPU (multi-CPU) or treat all as one (single-CPU)
-        by_cpu: dict[int, list[int]] = {}
+        # One bitmask of occupied time steps per CPU (a single mask when single-CPU)
+        by_cpu: dict[int, int] = {}
         for s in allocated_slots:
             t = s.get_time_index()
             if t >= self.deadline_slot_id:
                 continue
-            c = s.cpu_id
-            by_cpu.setdefault(c, []).append(t)
-        for times in by_cpu.values():
-            if len(times) < length:
-                continue
-            times = sorted(set(times))
-            for i in range(len(times) - length + 1):
-                if times[i + length - 1] - times[i] == length - 1:
-                    return True
+            by_cpu[s.cpu_id] = by_cpu.get(s.cpu_id, 0) | (1 << t)
+        for mask in by_cpu.values():
+            # After k steps, bit t is set iff times t..t+k are all occupied
+            run = mask
+            for _ in range(length - 1):
+                run &= run >> 1
+            if run:
+                return True
         return False
 
     def valuation(self, allocated_slots: Set[Slot] | FrozenSet[Slot]) -> float:
@@ -117,11 +116,45 @@ class Agent:
         """
         return [slot for slot in all_slots if slot.get_time_index() < self.deadline_slot_id]
     
+    def candidate_windows(self, all_slots: list[Slot]) -> list[FrozenSet[Slot]]:
+        """
+        Enumerate every bundle this agent could value: λ_i consecutive slots on one CPU before the deadline.
+        
+        The windows depend only on the slots, not on prices, so the auction computes
+        them once per run and passes them to find_best_bundle on every round.
+        
+        Args:
+            all_slots: List of all available slots
+            
+        Returns:
+            List of contiguous bundles, grouped by CPU and in time order
+        """
+        valid_slots = self.get_valid_slots(all_slots)
+        # Group by CPU so we only consider consecutive time windows on a single CPU
+        by_cpu: dict[int, list[Slot]] = {}
+        for s in valid_slots:
+            by_cpu.setdefault(s.cpu_id, []).append(s)
+        for c in by_cpu:
+            by_cpu[c] = sorted(by_cpu[c], key=lambda s: s.get_time_index())
+
+        windows: list[FrozenSet[Slot]] = []
+        for _cpu, group in by_cpu.items():
+            if len(group) < self.required_slots:
+                continue
+            for i in range(len(group) - self.required_slots + 1):
+                window = group[i : i + self.required_slots]
+                times = [s.get_time_index() for s in window]
+                if times[-1] - times[0] != self.required_slots - 1:
+                    continue
+                windows.append(frozenset(window))
+        return windows
+
     def find_best_bundle(
         self,
         all_slots: list[Slot],
-        prices: dict[int, float],
-        current_allocation: Set[Slot] | FrozenSet[Slot]
+        prices: dict[int, float] | list[float],
+        current_allocation: Set[Slot] | FrozenSet[Slot],
+        windows: Optional[list[FrozenSet[Slot]]] = None,
     ) -> tuple[FrozenSet[Slot], float]:
         """
         Find the bundle that maximizes surplus at given prices.
@@ -135,36 +168,26 @@ class Agent:
         
         Args:
             all_slots: List of all available slots
-            prices: Dictionary mapping slot_id to price
+            prices: Price per slot_id (dict, or list indexed by slot_id); must
+                cover every slot before the deadline
             current_allocation: Current slots held by this agent
+            windows: Precomputed candidate_windows(all_slots), if available
             
         Returns:
             Tuple of (best_bundle, best_surplus)
         """
-        valid_slots = self.get_valid_slots(all_slots)
-        # Group by CPU so we only consider consecutive time windows on a single CPU
-        by_cpu: dict[int, list[Slot]] = {}
-        for s in valid_slots:
-            by_cpu.setdefault(s.cpu_id, []).append(s)
-        for c in by_cpu:
-            by_cpu[c] = sorted(by_cpu[c], key=lambda s: s.get_time_index())
+        if windows is None:
+            windows = self.candidate_windows(all_slots)
 
         best_bundle: FrozenSet[Slot] = frozenset()
         best_surplus = 0.0
 
-        for _cpu, group in by_cpu.items():
-            if len(group) < self.required_slots:
-                continue
-            for i in range(len(group) - self.required_slots + 1):
-                window = group[i : i + self.required_slots]
-                times = [s.get_time_index() for s in window]
-                if times[-1] - times[0] != self.required_slots - 1:
-                    continue
-                bundle = frozenset(window)
-                surplus = self.surplus(bundle, prices)
-                if surplus > best_surplus:
-                    best_surplus = surplus
-                    best_bundle = bundle
+        for bundle in windows:
+            # Every window is a valid contiguous block, so v_i(bundle) = w_i
+            surplus = self.worth - sum(prices[slot.slot_id] for slot in bundle)
+            if surplus > best_surplus:
+                best_surplus = surplus
+                best_bundle = bundle
 
         if best_surplus < 0:
             return frozenset(), 0.0
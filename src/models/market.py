@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
 from typing import FrozenSet, Optional
-import copy
 
 from src.models.agent import Agent
 from src.models.slot import Slot
@@ -33,9 +32,10 @@ class Market:
         if not self.allocations:
             self.allocations = {agent.agent_id: frozenset() for agent in self.agents}
         
-        # Initialize bid prices to reserve prices
-        if not self.bid_prices:
-            self.bid_prices = {slot.slot_id: slot.reserve_price for slot in self.slots}
+        # Initialize bid prices to reserve prices. Every slot gets an entry, so hot
+        # paths can index bid_prices[slot_id] directly instead of .get(..., reserve).
+        # Given prices override the reserve; the caller's dict is not modified.
+        self.bid_prices = {slot.slot_id: slot.reserve_price for slot in self.slots} | dict(self.bid_prices)
     
     def get_allocation(self, agent: Agent) -> FrozenSet[Slot]:
         """Get the current allocation for an agent."""
@@ -45,6 +45,10 @@ class Market:
         """Set the allocation for an agent."""
         self.allocations[agent.agent_id] = slots
     
+    def get_sorted_slot_ids(self, agent: Agent) -> tuple[int, ...]:
+        """Get the slot ids allocated to an agent, in ascending order."""
+        return tuple(sorted(s.slot_id for s in self.get_allocation(agent)))
+    
     def get_bid_price(self, slot: Slot) -> float:
         """Get the current bid price for a slot."""
         return self.bid_prices.get(slot.slot_id, slot.reserve_price)
@@ -56,9 +60,9 @@ class Market:
     def get_unallocated_slots(self) -> FrozenSet[Slot]:
         """Get all slots that are not allocated to any agent (F_∅)."""
         allocated = set()
-        for slots in self.allocations.values():
-            allocated.update(slots)
-        return frozenset(set(self.slots) - allocated)
+        for bundle in self.allocations.values():
+            allocated.update(bundle)
+        return frozenset(slot for slot in self.slots if slot not in allocated)
     
     def get_slot_owner(self, slot: Slot) -> Optional[Agent]:
         """Get the agent who currently owns a slot, or None if unallocated."""
@@ -82,14 +86,12 @@ class Market:
         Returns:
             Dictionary mapping slot_id to ask price
         """
-        current_slots = self.get_allocation(agent)
-        ask_prices = {}
+        bid_prices = self.bid_prices
+        ask_prices = {slot.slot_id: bid_prices[slot.slot_id] + epsilon for slot in self.slots}
         
-        for slot in self.slots:
-            if slot in current_slots:
-                ask_prices[slot.slot_id] = self.bid_prices[slot.slot_id]
-            else:
-                ask_prices[slot.slot_id] = self.bid_prices[slot.slot_id] + epsilon
+        # Only the agent's own (few) slots keep their bid price
+        for slot in self.get_allocation(agent):
+            ask_prices[slot.slot_id] = bid_prices[slot.slot_id]
         
         return ask_prices
     
@@ -115,12 +117,13 @@ class Market:
         return reserve_value + agent_value
     
     def copy(self) -> "Market":
-        """Create a deep copy of the market state."""
+        """Create an independent copy of the market state."""
         return Market(
             agents=self.agents,  # Agents are immutable, no need to copy
             slots=self.slots,    # Slots are immutable, no need to copy
-            allocations=copy.deepcopy(self.allocations),
-            bid_prices=copy.deepcopy(self.bid_prices)
+            # Values are frozensets and floats, so copying the dicts is enough
+            allocations=dict(self.allocations),
+            bid_prices=dict(self.bid_prices)
         )
     
     def get_state_snapshot(self) -> dict:
@@ -132,10 +135,10 @@ class Market:
         """
         return {
             "allocations": {
-                agent.name: sorted([s.slot_id for s in self.allocations.get(agent.agent_id, frozenset())])
+                agent.name: list(self.get_sorted_slot_ids(agent))
                 for agent in self.agents
             },
-            "bid_prices": [self.bid_prices.get(s.slot_id, s.reserve_price) for s in self.slots],
+            "bid_prices": [self.bid_prices[s.slot_id] for s in self.slots],
             "solution_value": self.compute_solution_value()
         }
     
@@ -144,9 +147,8 @@ class Market:
         lines.append(f"  Agents: {len(self.agents)}, Slots: {len(self.slots)}")
         lines.append("  Allocations:")
         for agent in self.agents:
-            slots = self.allocations.get(agent.agent_id, frozenset())
-            slot_ids = sorted([s.slot_id for s in slots])
+            slot_ids = list(self.get_sorted_slot_ids(agent))
             lines.append(f"    {agent.name}: {slot_ids}")
-        lines.append(f"  Bid Prices: {[self.bid_prices.get(s.slot_id, 0) for s in self.slots]}")
+        lines.append(f"  Bid Prices: {[self.bid_prices[s.slot_id] for s in self.slots]}")
         lines.append(f"  Solution Value: {self.compute_solution_value():.2f}")
         return "\n".join(lines)
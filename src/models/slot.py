@@ -1,7 +1,8 @@
+import functools
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Slot:
     """
     Represents a discrete time slot in the scheduling problem.
@@ -26,7 +27,8 @@ class Slot:
     cpu_id: int = 0
     
     def __hash__(self) -> int:
-        return hash(self.slot_id)
+        # Same value as hash(slot_id): Python reduces an int returned by __hash__
+        return self.slot_id
     
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Slot):
@@ -46,6 +48,7 @@ class Slot:
         return self.slot_id < other.slot_id
 
 
+@functools.lru_cache(maxsize=None)
 def _time_label(hour: int) -> str:
     """Format hour as 9:00 AM / 12:00 PM / 1:00 PM."""
     if hour < 12:
@@ -5,20 +5,48 @@ Creates plots for price evolution, allocation timelines,
 solution value comparison, and convergence analysis.
 """
 
+import functools
+import os
 from typing import Optional
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
+from matplotlib.collections import LineCollection, PatchCollection
+from matplotlib.lines import Line2D
 
 from src.models.market import Market
 from src.auction.ascending import AuctionResult
 from src.experiments.metrics import EpsilonSensitivityResult
 
 
+# Resolution for saved figures; 100 keeps PNG encoding cheap, set PLOT_DPI=150
+# (or pass dpi=...) for publication-quality output.
+DEFAULT_DPI = int(os.environ.get("PLOT_DPI", "100"))
+
+# zlib level for PNG output; 1 encodes several times faster than Pillow's default
+# of 6 for somewhat larger files, which suits throwaway experiment plots
+PNG_COMPRESS_LEVEL = 1
+
+
+def save_figure(fig: plt.Figure, path: str, dpi: int = DEFAULT_DPI) -> None:
+    """Save a figure (format from the path's extension), using fast compression for PNGs."""
+    kwargs = {}
+    if str(path).lower().endswith(".png"):
+        kwargs["pil_kwargs"] = {"compress_level": PNG_COMPRESS_LEVEL}
+    fig.savefig(path, dpi=dpi, bbox_inches="tight", **kwargs)
+
+
+@functools.lru_cache(maxsize=64)
+def _colors(cmap_name: str, n: int) -> np.ndarray:
+    """n evenly spaced RGBA colors from a colormap (cached; callers must not modify)."""
+    return plt.get_cmap(cmap_name)(np.linspace(0, 1, n))
+
+
 def plot_price_evolution(
     result: AuctionResult,
     title: str = "Price Evolution During Auction",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot the evolution of bid prices over auction rounds.
@@ -27,6 +55,7 @@ def plot_price_evolution(
         result: Auction result with round history
         title: Plot title
         save_path: Path to save figure (if provided)
+        dpi: Resolution of the saved figure
         
     Returns:
         matplotlib Figure
@@ -35,33 +64,28 @@ def plot_price_evolution(
         print("No rounds to plot")
         return None
     
-    # Extract price history
-    num_slots = len(result.rounds[0].bid_prices)
-    rounds = range(len(result.rounds))
-    
-    prices_by_slot = [[] for _ in range(num_slots)]
-    for r in result.rounds:
-        for i, price in enumerate(r.bid_prices):
-            prices_by_slot[i].append(price)
+    # Extract price history as a (rounds x slots) matrix
+    prices = np.asarray([r.bid_prices for r in result.rounds], dtype=np.float64)
+    num_slots = prices.shape[1]
     
-    # Create plot
+    # Create plot: one line per column of the price matrix
     fig, ax = plt.subplots(figsize=(12, 6))
     
-    colors = plt.cm.tab10(np.linspace(0, 1, num_slots))
-    for i, prices in enumerate(prices_by_slot):
-        slot = result.market.slots[i]
-        ax.plot(rounds, prices, label=_slot_ylabel(slot), color=colors[i], linewidth=2)
+    handles = _draw_price_lines(
+        ax, prices, _colors("tab10", num_slots),
+        [_slot_ylabel(result.market.slots[i]) for i in range(num_slots)], linewidth=2
+    )
     
     ax.set_xlabel("Round", fontsize=12)
     ax.set_ylabel("Bid Price ($)", fontsize=12)
     ax.set_title(title, fontsize=14)
-    ax.legend(loc="upper left", bbox_to_anchor=(1.02, 1))
+    ax.legend(handles=handles, loc="upper left", bbox_to_anchor=(1.02, 1))
     ax.grid(True, alpha=0.3)
     
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     
     return fig
 
@@ -91,16 +115,50 @@ def _slots_by_cpu(market: Market) -> dict[int, list]:
     return by_cpu
 
 
+def _draw_slot_bars(ax, ys: list[int], colors: list) -> None:
+    """Draw one full-width bar per slot (like barh(y, 1, height=0.8)) as a single collection."""
+    bars = PatchCollection(
+        [mpatches.Rectangle((0, y - 0.4), 1, 0.8) for y in ys],
+        facecolors=colors, edgecolors="black", linewidths=1,
+    )
+    ax.add_collection(bars)
+    ax.autoscale_view()
+
+
+def _draw_price_lines(ax, prices: np.ndarray, colors, labels: list[str], linewidth: float) -> list:
+    """
+    Draw one price line per column of a (rounds x slots) matrix as a single collection.
+    
+    Returns proxy Line2D handles for the legend (a LineCollection has a single label).
+    """
+    rounds = np.arange(prices.shape[0], dtype=np.float64)
+    # (slots, rounds, 2) array of (round, price) points, one segment per slot
+    segments = np.stack(np.broadcast_arrays(rounds[None, :], prices.T), axis=-1)
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=linewidth))
+    ax.autoscale_view()
+    return [
+        Line2D([], [], color=color, linewidth=linewidth, label=label)
+        for color, label in zip(colors, labels)
+    ]
+
+
+def _cycle_colors(n: int) -> list:
+    """The first n colors of the default property cycle (what n ax.plot lines would get)."""
+    cycle = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    return [cycle[i % len(cycle)] for i in range(n)]
+
+
 def plot_allocation_timeline(
     market: Market,
     title: str = "Allocation Timeline",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot a Gantt-chart style allocation timeline.
     For 2 CPUs: two panels side by side (CPU 0 left, CPU 1 right), same time on y-axis.
     """
-    colors = plt.cm.Set3(np.linspace(0, 1, len(market.agents) + 1))
+    colors = _colors("Set3", len(market.agents) + 1)
     agent_colors = {agent.agent_id: colors[i] for i, agent in enumerate(market.agents)}
     agent_colors[None] = colors[-1]
 
@@ -115,15 +173,13 @@ def plot_allocation_timeline(
         for idx, cpu in enumerate(cpus):
             ax = axes[idx]
             slots = by_cpu[cpu]
-            for slot in slots:
-                owner = market.get_slot_owner(slot)
-                owner_id = owner.agent_id if owner else None
-                color = agent_colors[owner_id]
-                y = slot.get_time_index()
-                ax.barh(y, 1, left=0, height=0.8, color=color, edgecolor="black", linewidth=1)
+            owners = [market.get_slot_owner(slot) for slot in slots]
+            ys = [slot.get_time_index() for slot in slots]
+            _draw_slot_bars(ax, ys, [agent_colors[owner.agent_id if owner else None] for owner in owners])
+            for y, owner in zip(ys, owners):
                 label = owner.name if owner else "Unalloc"
                 ax.text(0.5, y, label, ha="center", va="center", fontsize=10)
-            ax.set_yticks([s.get_time_index() for s in slots])
+            ax.set_yticks(ys)
             ax.set_yticklabels([s.time_label for s in slots])
             ax.set_ylabel("Time" if idx == 0 else "")
             ax.set_xlim(0, 1)
@@ -135,14 +191,13 @@ def plot_allocation_timeline(
         axes[-1].legend(handles=patches, loc="upper left", bbox_to_anchor=(1.02, 1))
     else:
         fig, ax = plt.subplots(figsize=(12, max(6, len(market.slots) * 0.35)))
-        for slot in market.slots:
-            owner = market.get_slot_owner(slot)
-            owner_id = owner.agent_id if owner else None
-            color = agent_colors[owner_id]
-            ax.barh(slot.slot_id, 1, left=0, height=0.8, color=color, edgecolor="black", linewidth=1)
+        owners = [market.get_slot_owner(slot) for slot in market.slots]
+        ys = [slot.slot_id for slot in market.slots]
+        _draw_slot_bars(ax, ys, [agent_colors[owner.agent_id if owner else None] for owner in owners])
+        for y, owner in zip(ys, owners):
             label = owner.name if owner else "Unalloc"
-            ax.text(0.5, slot.slot_id, label, ha="center", va="center", fontsize=10)
-        ax.set_yticks([s.slot_id for s in market.slots])
+            ax.text(0.5, y, label, ha="center", va="center", fontsize=10)
+        ax.set_yticks(ys)
         ax.set_yticklabels([s.time_label for s in market.slots])
         ax.set_xlabel("Allocation", fontsize=12)
         ax.set_ylabel("Time Slot", fontsize=12)
@@ -154,14 +209,15 @@ def plot_allocation_timeline(
         ax.set_xticks([])
     plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     return fig
 
 
 def plot_allocation_and_prices(
     result: AuctionResult,
     title: str = "Allocation and Slot Prices",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot allocation with bid price shown inside each slot bar.
@@ -172,12 +228,13 @@ def plot_allocation_and_prices(
         result: Auction result (market with allocations and bid_prices)
         title: Plot title
         save_path: Path to save figure (if provided)
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure
     """
     market = result.market
-    colors = plt.cm.Set3(np.linspace(0, 1, len(market.agents) + 1))
+    colors = _colors("Set3", len(market.agents) + 1)
     agent_colors = {agent.agent_id: colors[i] for i, agent in enumerate(market.agents)}
     agent_colors[None] = colors[-1]
 
@@ -192,16 +249,14 @@ def plot_allocation_and_prices(
         for idx, cpu in enumerate(cpus):
             ax = axes[idx]
             slots = by_cpu[cpu]
-            for slot in slots:
-                owner = market.get_slot_owner(slot)
-                owner_id = owner.agent_id if owner else None
-                color = agent_colors[owner_id]
-                price = market.bid_prices.get(slot.slot_id, slot.reserve_price)
-                y = slot.get_time_index()
-                ax.barh(y, 1, left=0, height=0.8, color=color, edgecolor="black", linewidth=1)
+            owners = [market.get_slot_owner(slot) for slot in slots]
+            ys = [slot.get_time_index() for slot in slots]
+            _draw_slot_bars(ax, ys, [agent_colors[owner.agent_id if owner else None] for owner in owners])
+            for slot, y, owner in zip(slots, ys, owners):
+                price = market.bid_prices[slot.slot_id]
                 label = (owner.name if owner else "Unalloc") + f"  ${price:.2f}"
                 ax.text(0.5, y, label, ha="center", va="center", fontsize=10)
-            ax.set_yticks([s.get_time_index() for s in slots])
+            ax.set_yticks(ys)
             ax.set_yticklabels([s.time_label for s in slots])
             ax.set_ylabel("Time" if idx == 0 else "")
             ax.set_xlim(0, 1)
@@ -213,15 +268,14 @@ def plot_allocation_and_prices(
         axes[-1].legend(handles=patches, loc="upper left", bbox_to_anchor=(1.02, 1))
     else:
         fig, ax = plt.subplots(figsize=(12, max(6, len(market.slots) * 0.35)))
-        for slot in market.slots:
-            owner = market.get_slot_owner(slot)
-            owner_id = owner.agent_id if owner else None
-            color = agent_colors[owner_id]
-            price = market.bid_prices.get(slot.slot_id, slot.reserve_price)
-            ax.barh(slot.slot_id, 1, left=0, height=0.8, color=color, edgecolor="black", linewidth=1)
+        owners = [market.get_slot_owner(slot) for slot in market.slots]
+        ys = [slot.slot_id for slot in market.slots]
+        _draw_slot_bars(ax, ys, [agent_colors[owner.agent_id if owner else None] for owner in owners])
+        for slot, y, owner in zip(market.slots, ys, owners):
+            price = market.bid_prices[slot.slot_id]
             label = (owner.name if owner else "Unalloc") + f"  ${price:.2f}"
-            ax.text(0.5, slot.slot_id, label, ha="center", va="center", fontsize=10)
-        ax.set_yticks([s.slot_id for s in market.slots])
+            ax.text(0.5, y, label, ha="center", va="center", fontsize=10)
+        ax.set_yticks(ys)
         ax.set_yticklabels([s.time_label for s in market.slots])
         ax.set_ylabel("Time Slot", fontsize=12)
         ax.set_xlabel("CPU", fontsize=12)
@@ -233,7 +287,7 @@ def plot_allocation_and_prices(
         ax.legend(handles=patches, loc="upper left", bbox_to_anchor=(1.02, 1))
     plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     return fig
 
 
@@ -241,7 +295,8 @@ def plot_solution_value_comparison(
     auction_solution_value: float,
     reserve_solution_value: float,
     title: str = "Solution Value Comparison",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot bar chart comparing auction solution value to reserve-only.
@@ -251,6 +306,7 @@ def plot_solution_value_comparison(
         reserve_solution_value: Solution value if all slots unallocated
         title: Plot title
         save_path: Path to save figure
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure
@@ -268,14 +324,15 @@ def plot_solution_value_comparison(
     ax.set_ylim(0, max(values) * 1.15)
     plt.tight_layout()
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     return fig
 
 
 def plot_epsilon_sensitivity(
     sensitivity: EpsilonSensitivityResult,
     title: str = "Epsilon Sensitivity Analysis",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot epsilon sensitivity: epsilon vs iterations and epsilon vs solution value.
@@ -284,6 +341,7 @@ def plot_epsilon_sensitivity(
         sensitivity: Results from epsilon sensitivity analysis
         title: Plot title
         save_path: Path to save figure
+        dpi: Resolution of the saved figure
 
     Returns:
         matplotlib Figure
@@ -307,13 +365,14 @@ def plot_epsilon_sensitivity(
     plt.tight_layout(rect=[0, 0, 1, 0.92])
     fig.suptitle(title, fontsize=14, y=0.98)
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     return fig
 
 
 def plot_epsilon_sensitivity_all(
     results: list[tuple[str, EpsilonSensitivityResult]],
     save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot epsilon sensitivity for multiple experiments. Each row: epsilon vs iterations,
@@ -343,7 +402,7 @@ def plot_epsilon_sensitivity_all(
     plt.tight_layout(rect=[0, 0, 1, 0.96])
     fig.suptitle("Epsilon Sensitivity — All Experiments", fontsize=14, y=0.98)
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     return fig
 
 
@@ -351,7 +410,8 @@ def plot_convergence_trace(
     result: AuctionResult,
     max_rounds: int = 50,
     title: str = "Auction Convergence Trace",
-    save_path: Optional[str] = None
+    save_path: Optional[str] = None,
+    dpi: int = DEFAULT_DPI
 ) -> plt.Figure:
     """
     Plot a detailed trace of auction convergence.
@@ -361,6 +421,7 @@ def plot_convergence_trace(
         max_rounds: Maximum rounds to show
         title: Plot title
         save_path: Path to save figure
+        dpi: Resolution of the saved figure
         
     Returns:
         matplotlib Figure
@@ -378,15 +439,22 @@ def plot_convergence_trace(
     num_agents = len(result.market.agents)
     num_slots = len(result.market.slots)
     
-    # Create allocation matrix (rounds x slots) -> agent_id
+    # Create allocation matrix (rounds x slots) -> agent_id with one indexed store
+    cells = [
+        (r_idx, slot_id, agent_id)
+        for r_idx, r in enumerate(rounds_to_show)
+        for agent_id, slot_ids in r.allocations.items()
+        for slot_id in slot_ids
+    ]
     alloc_matrix = np.zeros((len(rounds_to_show), num_slots))
-    for r_idx, r in enumerate(rounds_to_show):
-        for agent_id, slot_ids in r.allocations.items():
-            for slot_id in slot_ids:
-                alloc_matrix[r_idx, slot_id] = agent_id
+    if cells:
+        round_idx, slot_idx, agent_ids = zip(*cells)
+        alloc_matrix[list(round_idx), list(slot_idx)] = agent_ids
     
+    # Rasterized so vector outputs (save_path ending in .pdf/.svg) embed the
+    # heatmap as one image while lines and text stay vector
     im = ax1.imshow(alloc_matrix.T, aspect="auto", cmap="tab10",
-                    vmin=0, vmax=num_agents + 1)
+                    vmin=0, vmax=num_agents + 1, rasterized=True)
     ax1.set_ylabel("Slot", fontsize=11)
     ax1.set_title("Allocation Over Rounds", fontsize=12)
     slots = result.market.slots
@@ -397,21 +465,22 @@ def plot_convergence_trace(
     cbar.set_label("Agent ID (0 = unallocated)")
 
     ax2 = axes[1]
-    for i in range(num_slots):
-        prices = [r.bid_prices[i] for r in rounds_to_show]
-        ax2.plot(range(len(rounds_to_show)), prices,
-                 label=_slot_ylabel(slots[i]) if i < len(slots) else f"Slot {i}", linewidth=1.5)
+    prices = np.asarray([r.bid_prices for r in rounds_to_show], dtype=np.float64)[:, :num_slots]
+    handles = _draw_price_lines(
+        ax2, prices, _cycle_colors(prices.shape[1]),
+        [_slot_ylabel(slots[i]) for i in range(prices.shape[1])], linewidth=1.5
+    )
     
     ax2.set_xlabel("Round", fontsize=11)
     ax2.set_ylabel("Bid Price ($)", fontsize=11)
     ax2.set_title("Price Evolution", fontsize=12)
-    ax2.legend(loc="upper left", bbox_to_anchor=(1.02, 1), fontsize=9)
+    ax2.legend(handles=handles, loc="upper left", bbox_to_anchor=(1.02, 1), fontsize=9)
     ax2.grid(True, alpha=0.3)
     
     fig.suptitle(title, fontsize=14)
     plt.tight_layout()
     
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches="tight")
+        save_figure(fig, save_path, dpi)
     
     return fig